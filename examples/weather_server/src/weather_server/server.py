@@ -4,9 +4,15 @@ from __future__ import annotations
 
 import asyncio
 import json
+import re
 import sys
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # optional: pip install orjson for faster JSON
+    orjson = None
+
 from .tools import TOOLS, handle_tool_call
 
 
@@ -60,6 +66,31 @@ class MCPServer:
 mcp = MCPServer()
 
 
+# orjson turns integers wider than 64 bits into floats, so leave lines that
+# may hold one to the stdlib (20+ digits covers everything past uint64)
+_LONG_DIGITS = re.compile(rb"\d{20}")
+
+
+def _loads(line: bytes) -> Any:
+    """Parse one JSON-RPC line, straight from bytes when orjson is available."""
+    if orjson is not None and not _LONG_DIGITS.search(line):
+        try:
+            return orjson.loads(line)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN or Infinity, which the stdlib accepts
+    return json.loads(line.decode())
+
+
+def _dumps_line(message: dict[str, Any]) -> bytes:
+    """Serialize a JSON-RPC message as a newline-terminated line of bytes."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(message, option=orjson.OPT_NON_STR_KEYS) + b"\n"
+        except TypeError:
+            pass  # e.g. ints beyond 64 bits, which the stdlib still handles
+    return (json.dumps(message) + "\n").encode()
+
+
 async def run_stdio() -> None:
     """Run the server over stdio (JSON-RPC line protocol)."""
     server = MCPServer()
@@ -77,12 +108,12 @@ async def run_stdio() -> None:
         if not line:
             break
         try:
-            request = json.loads(line.decode())
-        except json.JSONDecodeError:
+            request = _loads(line)
+        except json.JSONDecodeError:  # orjson.JSONDecodeError subclasses this
             continue
         response = await server.handle_request(request)
         if request.get("id") is not None:
-            writer.write((json.dumps(response) + "\n").encode())
+            writer.write(_dumps_line(response))
             await writer.drain()
 
 
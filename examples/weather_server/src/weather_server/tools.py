@@ -2,7 +2,24 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Awaitable, Callable
+
+# Canned data for the mock implementations below
+_SAMPLE_TEMPS: tuple[tuple[int, str], ...] = (
+    (72, "Sunny"),
+    (68, "Cloudy"),
+    (75, "Clear"),
+    (65, "Rain"),
+    (70, "Partly cloudy"),
+)
+
+_WEATHER_TEMPLATE = (
+    "Current weather in {city}:\n"
+    "Temperature: 72F (22C)\n"
+    "Conditions: Partly cloudy\n"
+    "Humidity: 45%\n"
+    "Wind: 8 mph NW"
+)
 
 TOOLS: list[dict[str, Any]] = [
     {
@@ -43,29 +60,17 @@ TOOLS: list[dict[str, Any]] = [
 
 async def handle_tool_call(name: str, arguments: dict[str, Any]) -> dict[str, Any]:
     """Dispatch a tool call by name."""
-    if name == "weather":
-        return await _tool_weather(arguments)
-    if name == "forecast":
-        return await _tool_forecast(arguments)
-    raise ValueError(f"Unknown tool: {name}")
+    handler = _TOOL_HANDLERS.get(name)
+    if handler is None:
+        raise ValueError(f"Unknown tool: {name}")
+    return await handler(arguments)
 
 
 async def _tool_weather(arguments: dict[str, Any]) -> dict[str, Any]:
     """Get current weather (mock implementation)."""
     city = arguments.get("query", "Unknown")
     return {
-        "content": [
-            {
-                "type": "text",
-                "text": (
-                    f"Current weather in {city}:\n"
-                    f"Temperature: 72F (22C)\n"
-                    f"Conditions: Partly cloudy\n"
-                    f"Humidity: 45%\n"
-                    f"Wind: 8 mph NW"
-                ),
-            }
-        ]
+        "content": [{"type": "text", "text": _WEATHER_TEMPLATE.format(city=city)}]
     }
 
 
@@ -73,11 +78,18 @@ async def _tool_forecast(arguments: dict[str, Any]) -> dict[str, Any]:
     """Get weather forecast (mock implementation)."""
     city = arguments.get("query", "Unknown")
     days = arguments.get("days", 3)
-    lines = [f"{days}-day forecast for {city}:"]
-    sample_temps = [(72, "Sunny"), (68, "Cloudy"), (75, "Clear"), (65, "Rain"), (70, "Partly cloudy")]
-    for i in range(min(days, 5)):
-        temp, cond = sample_temps[i]
-        lines.append(f"  Day {i + 1}: {temp}F - {cond}")
+    body = [
+        f"  Day {i}: {temp}F - {cond}"
+        for i, (temp, cond) in enumerate(_SAMPLE_TEMPS[: max(days, 0)], start=1)
+    ]
+    text = "\n".join([f"{days}-day forecast for {city}:", *body])
     return {
-        "content": [{"type": "text", "text": "\n".join(lines)}]
+        "content": [{"type": "text", "text": text}]
     }
+
+
+# Tool name -> handler, used by handle_tool_call()
+_TOOL_HANDLERS: dict[str, Callable[[dict[str, Any]], Awaitable[dict[str, Any]]]] = {
+    "weather": _tool_weather,
+    "forecast": _tool_forecast,
+}
@@ -2,19 +2,31 @@
 
 from __future__ import annotations
 
+import importlib
+import os
 import subprocess
 import sys
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
-from rich.console import Console
 
 from . import __version__
-from .scaffold import scaffold_project
-from .tester import MCPTestClient, print_report, run_test_suite
-from .validator import validate_project_structure
 
-console = Console()
+if TYPE_CHECKING:
+    from rich.console import Console
+
+# rich, jinja2 and jsonschema are imported inside the commands that need them,
+# so `--version`, `--help` and unrelated subcommands only pay for click.
+
+
+@lru_cache(maxsize=1)
+def _get_console() -> Console:
+    """Return the shared Rich console, importing rich on first use."""
+    from rich.console import Console
+
+    return Console()
 
 
 @click.group()
@@ -35,6 +47,10 @@ def new(name: str, tools: str, resources: str, description: str, author: str, ou
 
     Example: mcp-forge new my-server --tools weather,calculator
     """
+    from .scaffold import scaffold_project
+
+    console = _get_console()
+
     tool_list = [t.strip() for t in tools.split(",") if t.strip()] if tools else []
     resource_list = [r.strip() for r in resources.split(",") if r.strip()] if resources else []
 
@@ -66,33 +82,51 @@ def new(name: str, tools: str, resources: str, description: str, author: str, ou
     console.print()
 
 
-def _print_tree(path: Path, prefix: str = "", is_last: bool = True) -> None:
+def _print_tree(path: str | os.PathLike[str], prefix: str = "", is_last: bool = True) -> None:
     """Print a directory tree."""
-    entries = sorted(path.iterdir(), key=lambda p: (p.is_file(), p.name))
-    entries = [e for e in entries if not e.name.startswith(".") or e.name == ".gitignore"]
-    for i, entry in enumerate(entries):
+    console = _get_console()
+
+    # DirEntry caches the file type from the directory listing, so sorting and
+    # recursing does not cost an extra stat() per entry. Filter and build the
+    # (dirs first, name) sort keys in one pass; names are unique, so the
+    # DirEntry itself is never compared.
+    with os.scandir(path) as it:
+        entries = sorted(
+            (e.is_file(), e.name, e)
+            for e in it
+            if not e.name.startswith(".") or e.name == ".gitignore"
+        )
+    for i, (_, name, entry) in enumerate(entries):
         is_last_entry = i == len(entries) - 1
         connector = "└── " if is_last_entry else "├── "
-        console.print(f"{prefix}{connector}{entry.name}")
+        console.print(f"{prefix}{connector}{name}")
         if entry.is_dir():
             extension = "    " if is_last_entry else "│   "
-            _print_tree(entry, prefix + extension, is_last_entry)
+            _print_tree(entry.path, prefix + extension, is_last_entry)
 
 
 @cli.command()
 @click.option("--cmd", required=True, help="Command to start the MCP server (e.g. 'python -m my_server.server').")
 @click.option("--cwd", type=click.Path(exists=True), default=None, help="Working directory for the server.")
-def test(cmd: str, cwd: str | None) -> None:
+@click.option(
+    "--timeout", type=float, default=10.0, show_default=True,
+    help="Seconds to wait for each server response.",
+)
+def test(cmd: str, cwd: str | None, timeout: float) -> None:
     """Run the MCP test suite against a server.
 
     Example: mcp-forge test --cmd 'python -m my_server.server'
     """
+    from .tester import print_report, run_test_suite
+
+    console = _get_console()
+
     console.print(f"\n[bold]🧪 Testing MCP server: [cyan]{cmd}[/cyan][/bold]\n")
 
     server_cmd = cmd.split()
     cwd_path = Path(cwd) if cwd else None
 
-    report = run_test_suite(server_cmd, cwd=cwd_path)
+    report = run_test_suite(server_cmd, cwd=cwd_path, timeout=timeout)
     print_report(report, console)
     console.print()
 
@@ -107,6 +141,10 @@ def validate(project_dir: str) -> None:
 
     Example: mcp-forge validate ./my-server
     """
+    from .validator import validate_project_structure
+
+    console = _get_console()
+
     path = Path(project_dir)
     console.print(f"\n[bold]🔍 Validating: [cyan]{path.name}[/cyan][/bold]\n")
 
@@ -128,6 +166,62 @@ def validate(project_dir: str) -> None:
     console.print()
 
 
+# Programmatic entry points for the publish tools: module -> (import path, callable)
+_IN_PROCESS_ENTRY_POINTS: dict[str, tuple[str, str]] = {
+    "build": ("build.__main__", "main"),
+    "twine": ("twine.cli", "dispatch"),
+}
+
+
+def _run_in_process(module: str, args: list[str], cwd: Path) -> tuple[int, str] | None:
+    """Run a publish tool inside this interpreter, skipping a Python startup.
+
+    Returns (exit code, error detail), or None if the tool is not importable.
+    """
+    import_path, attr = _IN_PROCESS_ENTRY_POINTS[module]
+    try:
+        entry = getattr(importlib.import_module(import_path), attr)
+    except ImportError:
+        return None
+
+    old_cwd = os.getcwd()
+    os.chdir(cwd)
+    try:
+        error = entry(args)
+    except SystemExit as exc:
+        if exc.code is None or isinstance(exc.code, int):
+            return exc.code or 0, ""
+        return 1, str(exc.code)
+    except Exception as exc:
+        return 1, str(exc)
+    finally:
+        os.chdir(old_cwd)
+    return (1, "") if error else (0, "")
+
+
+def _run_step(module: str, args: list[str], cwd: Path) -> tuple[int, str]:
+    """Run a publish step and return (exit code, error detail).
+
+    The tool runs in-process when it is installed alongside mcp-forge, with
+    its own output going straight to the terminal. Otherwise it runs as
+    ``python -m <module>`` with stdout and stderr captured together as raw
+    bytes, which are only decoded when the step fails.
+    """
+    outcome = _run_in_process(module, args, cwd)
+    if outcome is not None:
+        return outcome
+
+    result = subprocess.run(
+        [sys.executable, "-m", module, *args],
+        cwd=cwd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+    )
+    if result.returncode != 0:
+        return result.returncode, result.stdout.decode(errors="replace")
+    return 0, ""
+
+
 @cli.command()
 @click.argument("project_dir", type=click.Path(exists=True), default=".")
 @click.option("--repository", default="pypi", help="Target repository (pypi or testpypi).")
@@ -137,19 +231,16 @@ def publish(project_dir: str, repository: str, dry_run: bool) -> None:
 
     Example: mcp-forge publish ./my-server
     """
+    console = _get_console()
+
     path = Path(project_dir)
     console.print(f"\n[bold]📦 Publishing: [cyan]{path.name}[/cyan][/bold]\n")
 
     # Build
     console.print("[dim]Building package...[/dim]")
-    result = subprocess.run(
-        [sys.executable, "-m", "build"],
-        cwd=path,
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode != 0:
-        console.print(f"[red]Build failed:[/red]\n{result.stderr}")
+    returncode, detail = _run_step("build", [], cwd=path)
+    if returncode != 0:
+        console.print(f"[red]Build failed:[/red]\n{detail}")
         raise SystemExit(1)
 
     console.print("[green]✓[/green] Package built successfully")
@@ -164,14 +255,11 @@ def publish(project_dir: str, repository: str, dry_run: bool) -> None:
         else "https://upload.pypi.org/legacy/"
     )
     console.print(f"[dim]Uploading to {repository}...[/dim]")
-    result = subprocess.run(
-        [sys.executable, "-m", "twine", "upload", "--repository-url", repo_url, "dist/*"],
-        cwd=path,
-        capture_output=True,
-        text=True,
+    returncode, detail = _run_step(
+        "twine", ["upload", "--repository-url", repo_url, "dist/*"], cwd=path
     )
-    if result.returncode != 0:
-        console.print(f"[red]Upload failed:[/red]\n{result.stderr}")
+    if returncode != 0:
+        console.print(f"[red]Upload failed:[/red]\n{detail}")
         raise SystemExit(1)
 
     console.print(f"[green]✓[/green] Published to {repository}!")
@@ -181,8 +269,12 @@ def publish(project_dir: str, repository: str, dry_run: bool) -> None:
 @cli.command()
 @click.option("--cmd", required=True, help="Command to start the MCP server.")
 @click.option("--cwd", type=click.Path(exists=True), default=None, help="Working directory for the server.")
+@click.option(
+    "--timeout", type=float, default=10.0, show_default=True,
+    help="Seconds to wait for each server response.",
+)
 @click.option("--json-output", is_flag=True, help="Output as JSON instead of rich tables.")
-def inspect(cmd: str, cwd: str | None, json_output: bool) -> None:
+def inspect(cmd: str, cwd: str | None, timeout: float, json_output: bool) -> None:
     """Inspect a running MCP server's capabilities.
 
     Connects to a server, runs initialize, and displays all
@@ -192,10 +284,14 @@ def inspect(cmd: str, cwd: str | None, json_output: bool) -> None:
     """
     import json as json_mod
 
+    from .tester import MCPTestClient
+
+    console = _get_console()
+
     server_cmd = cmd.split()
     cwd_path = Path(cwd) if cwd else None
 
-    client = MCPTestClient(server_cmd, cwd=cwd_path)
+    client = MCPTestClient(server_cmd, cwd=cwd_path, timeout=timeout)
 
     try:
         client.start()
@@ -317,6 +413,10 @@ def info(project_dir: str, fmt: str) -> None:
     import json as json_mod
     import re
 
+    from .validator import validate_project_structure
+
+    console = _get_console()
+
     path = Path(project_dir)
 
     # Read pyproject.toml
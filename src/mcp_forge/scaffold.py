@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Sequence
 
-from jinja2 import Environment, PackageLoader, select_autoescape
+from jinja2 import Environment, PackageLoader, Template, select_autoescape
 
 # Valid project names: alphanumeric, hyphens, underscores (must start with a letter)
 _PROJECT_NAME_RE = re.compile(r"^[a-zA-Z][a-zA-Z0-9_-]*$")
@@ -14,9 +16,29 @@ _PROJECT_NAME_RE = re.compile(r"^[a-zA-Z][a-zA-Z0-9_-]*$")
 # Valid tool names: alphanumeric and underscores only
 _TOOL_NAME_RE = re.compile(r"^[a-zA-Z][a-zA-Z0-9_]*$")
 
+# Separator translation tables for snake_case() and title_case()
+_SNAKE_TABLE = str.maketrans({"-": "_", " ": "_"})
+_TITLE_TABLE = str.maketrans({"-": " ", "_": " "})
 
+# Templates rendered into every generated project
+_TEMPLATE_NAMES = (
+    "server.py.j2",
+    "tools.py.j2",
+    "resources.py.j2",
+    "init.py.j2",
+    "project_pyproject.toml.j2",
+    "project_readme.md.j2",
+    "dockerfile.j2",
+)
+
+
+# Thread count for writing generated files
+_WRITE_WORKERS = 4
+
+
+@lru_cache(maxsize=1)
 def get_template_env() -> Environment:
-    """Create a Jinja2 environment that loads from the templates/ directory."""
+    """Return the shared Jinja2 environment that loads from the templates/ directory."""
     return Environment(
         loader=PackageLoader("mcp_forge", "templates"),
         autoescape=select_autoescape([]),
@@ -26,14 +48,27 @@ def get_template_env() -> Environment:
     )
 
 
+@lru_cache(maxsize=1)
+def _load_templates() -> dict[str, Template]:
+    """Parse and compile the project templates once per process."""
+    env = get_template_env()
+    return {name: env.get_template(name) for name in _TEMPLATE_NAMES}
+
+
+def _write_output(output: tuple[Path, str]) -> None:
+    """Write one rendered (path, content) pair to disk."""
+    path, content = output
+    path.write_text(content)
+
+
 def snake_case(name: str) -> str:
     """Convert a project name like 'my-server' to 'my_server'."""
-    return name.replace("-", "_").replace(" ", "_").lower()
+    return name.translate(_SNAKE_TABLE).lower()
 
 
 def title_case(name: str) -> str:
     """Convert 'my-server' to 'My Server'."""
-    return name.replace("-", " ").replace("_", " ").title()
+    return name.translate(_TITLE_TABLE).title()
 
 
 def validate_project_name(name: str) -> None:
@@ -109,7 +144,7 @@ def scaffold_project(
     ]:
         d.mkdir(parents=True, exist_ok=True)
 
-    env = get_template_env()
+    templates = _load_templates()
 
     context = {
         "project_name": name,
@@ -132,11 +167,13 @@ def scaffold_project(
         "dockerfile.j2": project_root / "Dockerfile",
     }
 
-    for template_name, dest_path in file_map.items():
-        template = env.get_template(template_name)
-        dest_path.write_text(template.render(**context))
+    # Render serially (CPU-bound), then write all files in one batch below
+    outputs: list[tuple[Path, str]] = [
+        (dest_path, templates[template_name].render(**context))
+        for template_name, dest_path in file_map.items()
+    ]
 
-    # Write a basic test file
+    # Basic test file
     test_content = f'''"""Basic tests for {pkg_name}."""
 
 import importlib
@@ -151,11 +188,16 @@ def test_server_module():
     mod = importlib.import_module("{pkg_name}.server")
     assert hasattr(mod, "mcp")
 '''
-    (project_root / "tests" / f"test_{pkg_name}.py").write_text(test_content)
+    outputs.append((project_root / "tests" / f"test_{pkg_name}.py", test_content))
 
-    # Write .gitignore
-    (project_root / ".gitignore").write_text(
-        "__pycache__/\n*.pyc\n*.egg-info/\ndist/\nbuild/\n.venv/\n"
-    )
+    # .gitignore
+    outputs.append((
+        project_root / ".gitignore",
+        "__pycache__/\n*.pyc\n*.egg-info/\ndist/\nbuild/\n.venv/\n",
+    ))
+
+    # The writes are independent, so overlap their I/O
+    with ThreadPoolExecutor(max_workers=_WRITE_WORKERS) as pool:
+        list(pool.map(_write_output, outputs))
 
     return project_root
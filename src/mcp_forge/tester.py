@@ -3,14 +3,67 @@
 from __future__ import annotations
 
 import json
+import queue
+import re
 import subprocess
+import threading
+import time
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import IO, Any, Callable, Sequence
 
 from rich.console import Console
 from rich.table import Table
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
+# Seconds to wait for each server response
+DEFAULT_TIMEOUT = 10.0
+
+
+def _encode_message(message: dict[str, Any]) -> bytes:
+    """Serialize a JSON-RPC message to a newline-terminated line of bytes."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(message, option=orjson.OPT_NON_STR_KEYS) + b"\n"
+        except TypeError:
+            pass  # e.g. ints beyond 64 bits, which the stdlib still handles
+    return (json.dumps(message) + "\n").encode()
+
+
+# orjson turns integers wider than 64 bits into floats, so leave lines that
+# may hold one to the stdlib (20+ digits covers everything past uint64)
+_LONG_DIGITS = re.compile(rb"\d{20}")
+
+
+def _decode_message(line: bytes) -> dict[str, Any]:
+    """Parse a JSON-RPC message from a line of bytes."""
+    if orjson is not None and not _LONG_DIGITS.search(line):
+        try:
+            result: dict[str, Any] = orjson.loads(line)
+            return result
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN or Infinity, which the stdlib accepts
+    result = json.loads(line.decode())
+    return result
+
+
+def _pump_lines(stream: IO[bytes] | None, lines: queue.Queue[bytes | Exception]) -> None:
+    """Forward lines from a stream into a queue, ending with b"" or the read error."""
+    if stream is None:
+        lines.put(b"")
+        return
+    try:
+        for line in iter(stream.readline, b""):
+            lines.put(line)
+    except Exception as exc:
+        lines.put(exc)
+        return
+    lines.put(b"")
+
 
 @dataclass
 class TestResult:
@@ -32,13 +85,17 @@ class TestReport:
 
     results: list[TestResult] = field(default_factory=list)
 
+    def add(self, result: TestResult) -> None:
+        """Record a result."""
+        self.results.append(result)
+
     @property
     def passed(self) -> int:
         return sum(1 for r in self.results if r.passed)
 
     @property
     def failed(self) -> int:
-        return sum(1 for r in self.results if not r.passed)
+        return len(self.results) - self.passed
 
     @property
     def total(self) -> int:
@@ -48,11 +105,18 @@ class TestReport:
 class MCPTestClient:
     """Test client that communicates with an MCP server over stdio."""
 
-    def __init__(self, server_cmd: list[str], cwd: Path | None = None) -> None:
+    def __init__(
+        self,
+        server_cmd: list[str],
+        cwd: Path | None = None,
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> None:
         self.server_cmd = server_cmd
         self.cwd = cwd
+        self.timeout = timeout
         self._process: subprocess.Popen[bytes] | None = None
         self._request_id = 0
+        self._lines: queue.Queue[bytes | Exception] = queue.Queue()
 
     def start(self) -> None:
         """Start the server process."""
@@ -63,6 +127,14 @@ class MCPTestClient:
             stderr=subprocess.PIPE,
             cwd=self.cwd,
         )
+        # Read stdout on a background thread so every wait for a response can
+        # be bounded by self.timeout instead of blocking in readline().
+        self._lines = queue.Queue()
+        threading.Thread(
+            target=_pump_lines,
+            args=(self._process.stdout, self._lines),
+            daemon=True,
+        ).start()
 
     def stop(self) -> None:
         """Stop the server process."""
@@ -71,30 +143,85 @@ class MCPTestClient:
             self._process.wait(timeout=5)
             self._process = None
 
+    def _read_line(self, deadline: float | None = None) -> bytes:
+        """Return the next line from the server.
+
+        Waits at most self.timeout seconds, or until ``deadline`` (a
+        time.monotonic() value) when one is given.
+        """
+        if deadline is None:
+            wait = self.timeout
+        else:
+            wait = max(deadline - time.monotonic(), 0.0)
+        try:
+            item = self._lines.get(timeout=wait)
+        except queue.Empty:
+            raise TimeoutError(f"No response from server within {self.timeout}s") from None
+        if isinstance(item, Exception) or not item:
+            # End of stream and read errors are final, keep them for later reads
+            self._lines.put(item)
+        if isinstance(item, Exception):
+            raise item
+        if not item:
+            raise RuntimeError("No response from server")
+        return item
+
     def send_request(self, method: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
         """Send a JSON-RPC request and return the response."""
         if not self._process or not self._process.stdin or not self._process.stdout:
             raise RuntimeError("Server not started")
 
+        request = self._next_request(method, params)
+        self._process.stdin.write(_encode_message(request))
+        self._process.stdin.flush()
+
+        # Skip anything that isn't our reply, such as a late reply to an
+        # earlier request that timed out or a server notification
+        deadline = time.monotonic() + self.timeout
+        while True:
+            response = _decode_message(self._read_line(deadline))
+            if response.get("id") == request["id"]:
+                return response
+
+    def send_requests_batch(
+        self, requests: Sequence[tuple[str, dict[str, Any] | None]]
+    ) -> list[dict[str, Any]]:
+        """Send independent JSON-RPC requests back-to-back and return their responses.
+
+        All requests are written with a single flush before any response is
+        read. Responses are matched to requests by id and returned in request order.
+        """
+        if not self._process or not self._process.stdin or not self._process.stdout:
+            raise RuntimeError("Server not started")
+
+        batch = [self._next_request(method, params) for method, params in requests]
+        self._process.stdin.write(b"".join(_encode_message(r) for r in batch))
+        self._process.stdin.flush()
+
+        # As in send_request, lines with ids outside this batch are dropped
+        deadline = time.monotonic() + self.timeout
+        pending = {r["id"] for r in batch}
+        by_id: dict[Any, dict[str, Any]] = {}
+        while pending:
+            response = _decode_message(self._read_line(deadline))
+            response_id = response.get("id")
+            if response_id in pending:
+                pending.discard(response_id)
+                by_id[response_id] = response
+
+        return [by_id[request["id"]] for request in batch]
+
+    def _next_request(self, method: str, params: dict[str, Any] | None) -> dict[str, Any]:
+        """Build a JSON-RPC request with the next request id."""
         self._request_id += 1
-        request = {
+        request: dict[str, Any] = {
             "jsonrpc": "2.0",
             "id": self._request_id,
             "method": method,
         }
         if params:
             request["params"] = params
-
-        data = json.dumps(request) + "\n"
-        self._process.stdin.write(data.encode())
-        self._process.stdin.flush()
-
-        line = self._process.stdout.readline()
-        if not line:
-            raise RuntimeError("No response from server")
-
-        result: dict[str, Any] = json.loads(line.decode())
-        return result
+        return request
 
     def send_notification(self, method: str, params: dict[str, Any] | None = None) -> None:
         """Send a JSON-RPC notification (no response expected)."""
@@ -108,103 +235,121 @@ class MCPTestClient:
         if params:
             notification["params"] = params
 
-        data = json.dumps(notification) + "\n"
-        self._process.stdin.write(data.encode())
+        self._process.stdin.write(_encode_message(notification))
         self._process.stdin.flush()
 
 
-def run_test_suite(server_cmd: list[str], cwd: Path | None = None) -> TestReport:
+# A suite check sends its requests and returns one result per test name it
+# covers. ``state`` carries responses that later checks can reuse.
+_SuiteCheck = Callable[[MCPTestClient, dict[str, Any]], list[TestResult]]
+
+
+def _check_initialize(client: MCPTestClient, state: dict[str, Any]) -> list[TestResult]:
+    resp = client.send_request("initialize", {
+        "protocolVersion": "2024-11-05",
+        "capabilities": {},
+        "clientInfo": {"name": "mcp-forge-tester", "version": "0.1.0"},
+    })
+    if "result" not in resp:
+        return [TestResult("initialize", False, f"Error: {resp.get('error')}", resp)]
+    result = resp["result"]
+    has_version = "protocolVersion" in result
+    has_info = "serverInfo" in result
+    has_caps = "capabilities" in result
+    ok = has_version and has_info and has_caps
+    msg = "initialize response valid" if ok else f"Missing fields: version={has_version} info={has_info} caps={has_caps}"
+    return [TestResult("initialize", ok, msg, resp)]
+
+
+def _check_tools_list(client: MCPTestClient, state: dict[str, Any]) -> list[TestResult]:
+    resp = state["tools/list"] = client.send_request("tools/list")
+    if "result" not in resp:
+        return [TestResult("tools/list", False, f"Error: {resp.get('error')}", resp)]
+    tools = resp["result"].get("tools", [])
+    ok = isinstance(tools, list)
+    return [TestResult("tools/list", ok, f"Found {len(tools)} tools", resp)]
+
+
+def _check_tools_call(client: MCPTestClient, state: dict[str, Any]) -> list[TestResult]:
+    # Call the first tool if available, reusing the tools/list response
+    if "tools/list" not in state:
+        raise RuntimeError("tools/list did not respond")
+    tools = state["tools/list"].get("result", {}).get("tools", [])
+    if not tools:
+        return [TestResult("tools/call", True, "No tools to test (skipped)")]
+    tool_name = tools[0]["name"]
+    resp = client.send_request("tools/call", {
+        "name": tool_name,
+        "arguments": {"query": "test"},
+    })
+    if "result" not in resp:
+        return [TestResult("tools/call", False, f"Error: {resp.get('error')}", resp)]
+    content = resp["result"].get("content", [])
+    ok = len(content) > 0
+    return [TestResult("tools/call", ok, f"Called '{tool_name}' successfully", resp)]
+
+
+def _check_ping_and_unknown(client: MCPTestClient, state: dict[str, Any]) -> list[TestResult]:
+    # Independent requests, so pipelined in one batch
+    ping_resp, unknown_resp = client.send_requests_batch([
+        ("ping", None),
+        ("nonexistent/method", None),
+    ])
+    ok = "result" in ping_resp
+    msg = "Ping OK" if ok else f"Error: {ping_resp.get('error')}"
+    ping = TestResult("ping", ok, msg, ping_resp)
+    ok = "error" in unknown_resp
+    msg = "Correctly returned error for unknown method" if ok else "Should have returned error"
+    return [ping, TestResult("unknown_method", ok, msg, unknown_resp)]
+
+
+# Checks run in order between server_start and server_stop. Each entry lists the
+# test names the check reports, so a check that raises fails all of them.
+_SUITE: tuple[tuple[tuple[str, ...], _SuiteCheck], ...] = (
+    (("initialize",), _check_initialize),
+    (("tools/list",), _check_tools_list),
+    (("tools/call",), _check_tools_call),
+    (("ping", "unknown_method"), _check_ping_and_unknown),
+)
+
+
+def run_test_suite(
+    server_cmd: list[str],
+    cwd: Path | None = None,
+    timeout: float = DEFAULT_TIMEOUT,
+) -> TestReport:
     """Run the standard MCP test suite against a server.
 
     Args:
         server_cmd: Command to start the server (e.g. ["python", "-m", "my_server.server"]).
         cwd: Working directory for the server process.
+        timeout: Seconds to wait for each response before failing that test.
 
     Returns:
         TestReport with all results.
     """
     report = TestReport()
-    client = MCPTestClient(server_cmd, cwd=cwd)
+    client = MCPTestClient(server_cmd, cwd=cwd, timeout=timeout)
 
     try:
         client.start()
     except Exception as exc:
-        report.results.append(TestResult("server_start", False, str(exc)))
+        report.add(TestResult("server_start", False, str(exc)))
         return report
 
-    report.results.append(TestResult("server_start", True, "Server started successfully"))
+    report.add(TestResult("server_start", True, "Server started successfully"))
 
-    # Test: initialize
-    try:
-        resp = client.send_request("initialize", {
-            "protocolVersion": "2024-11-05",
-            "capabilities": {},
-            "clientInfo": {"name": "mcp-forge-tester", "version": "0.1.0"},
-        })
-        if "result" in resp:
-            result = resp["result"]
-            has_version = "protocolVersion" in result
-            has_info = "serverInfo" in result
-            has_caps = "capabilities" in result
-            ok = has_version and has_info and has_caps
-            msg = "initialize response valid" if ok else f"Missing fields: version={has_version} info={has_info} caps={has_caps}"
-            report.results.append(TestResult("initialize", ok, msg, resp))
-        else:
-            report.results.append(TestResult("initialize", False, f"Error: {resp.get('error')}", resp))
-    except Exception as exc:
-        report.results.append(TestResult("initialize", False, str(exc)))
-
-    # Test: tools/list
-    try:
-        resp = client.send_request("tools/list")
-        if "result" in resp:
-            tools = resp["result"].get("tools", [])
-            ok = isinstance(tools, list)
-            report.results.append(TestResult("tools/list", ok, f"Found {len(tools)} tools", resp))
-        else:
-            report.results.append(TestResult("tools/list", False, f"Error: {resp.get('error')}", resp))
-    except Exception as exc:
-        report.results.append(TestResult("tools/list", False, str(exc)))
-
-    # Test: tools/call (first tool if available)
-    try:
-        resp = client.send_request("tools/list")
-        tools = resp.get("result", {}).get("tools", [])
-        if tools:
-            tool_name = tools[0]["name"]
-            resp2 = client.send_request("tools/call", {
-                "name": tool_name,
-                "arguments": {"query": "test"},
-            })
-            if "result" in resp2:
-                content = resp2["result"].get("content", [])
-                ok = len(content) > 0
-                report.results.append(TestResult("tools/call", ok, f"Called '{tool_name}' successfully", resp2))
-            else:
-                report.results.append(TestResult("tools/call", False, f"Error: {resp2.get('error')}", resp2))
-        else:
-            report.results.append(TestResult("tools/call", True, "No tools to test (skipped)"))
-    except Exception as exc:
-        report.results.append(TestResult("tools/call", False, str(exc)))
-
-    # Test: ping
-    try:
-        resp = client.send_request("ping")
-        ok = "result" in resp
-        report.results.append(TestResult("ping", ok, "Ping OK" if ok else f"Error: {resp.get('error')}", resp))
-    except Exception as exc:
-        report.results.append(TestResult("ping", False, str(exc)))
-
-    # Test: unknown method returns error
-    try:
-        resp = client.send_request("nonexistent/method")
-        ok = "error" in resp
-        report.results.append(TestResult("unknown_method", ok, "Correctly returned error for unknown method" if ok else "Should have returned error", resp))
-    except Exception as exc:
-        report.results.append(TestResult("unknown_method", False, str(exc)))
+    state: dict[str, Any] = {}
+    for names, check in _SUITE:
+        try:
+            results = check(client, state)
+        except Exception as exc:
+            results = [TestResult(name, False, str(exc)) for name in names]
+        for result in results:
+            report.add(result)
 
     client.stop()
-    report.results.append(TestResult("server_stop", True, "Server stopped cleanly"))
+    report.add(TestResult("server_stop", True, "Server stopped cleanly"))
 
     return report
 
@@ -2,14 +2,30 @@
 
 from __future__ import annotations
 
+import os
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Final
 
 import jsonschema
 
+try:
+    import jsonschema_rs
+except ImportError:  # pragma: no cover - optional speedup
+    jsonschema_rs = None  # type: ignore[assignment]
+
+try:
+    import fastjsonschema
+except ImportError:  # pragma: no cover - optional speedup
+    fastjsonschema = None
+
+# The schemas are module-level constants, built once at import. They stay plain
+# dicts (jsonschema's meta-schema rejects MappingProxyType) and are marked Final
+# so type checkers flag rebinding.
+
 # JSON Schema for MCP tool definition
-TOOL_SCHEMA: dict[str, Any] = {
+TOOL_SCHEMA: Final[dict[str, Any]] = {
     "type": "object",
     "required": ["name", "description", "inputSchema"],
     "properties": {
@@ -28,7 +44,7 @@ TOOL_SCHEMA: dict[str, Any] = {
 }
 
 # JSON Schema for initialize response
-INITIALIZE_RESPONSE_SCHEMA: dict[str, Any] = {
+INITIALIZE_RESPONSE_SCHEMA: Final[dict[str, Any]] = {
     "type": "object",
     "required": ["protocolVersion", "capabilities", "serverInfo"],
     "properties": {
@@ -46,7 +62,7 @@ INITIALIZE_RESPONSE_SCHEMA: dict[str, Any] = {
 }
 
 # JSON Schema for tool call result
-TOOL_RESULT_SCHEMA: dict[str, Any] = {
+TOOL_RESULT_SCHEMA: Final[dict[str, Any]] = {
     "type": "object",
     "required": ["content"],
     "properties": {
@@ -64,7 +80,7 @@ TOOL_RESULT_SCHEMA: dict[str, Any] = {
     },
 }
 
-RESOURCE_SCHEMA: dict[str, Any] = {
+RESOURCE_SCHEMA: Final[dict[str, Any]] = {
     "type": "object",
     "required": ["uri", "name"],
     "properties": {
@@ -76,7 +92,143 @@ RESOURCE_SCHEMA: dict[str, Any] = {
 }
 
 
-@dataclass
+# Draft7Validator.check_schema builds a fresh meta-schema validator on every
+# call; build it once and share it across the schema checks below.
+_META_VALIDATOR = jsonschema.Draft7Validator(
+    jsonschema.Draft7Validator.META_SCHEMA,
+    format_checker=jsonschema.Draft7Validator.FORMAT_CHECKER,
+)
+
+
+def _build_validator(schema: dict[str, Any]) -> Any:
+    """Check a static schema against the meta-schema once and build its validator.
+
+    None of the MCP schemas use "format", so format checking is left off.
+    """
+    error = jsonschema.exceptions.best_match(_META_VALIDATOR.iter_errors(schema))
+    if error is not None:
+        raise jsonschema.SchemaError.create_from(error)
+    return jsonschema.Draft7Validator(schema, format_checker=None)
+
+
+# The schemas above are static, so their validators are built once at import
+# time instead of on every validate_* call.
+_TOOL_VALIDATOR = _build_validator(TOOL_SCHEMA)
+_INIT_VALIDATOR = _build_validator(INITIALIZE_RESPONSE_SCHEMA)
+_TOOL_RESULT_VALIDATOR = _build_validator(TOOL_RESULT_SCHEMA)
+_RESOURCE_VALIDATOR = _build_validator(RESOURCE_SCHEMA)
+
+
+def _compile_fast(schema: dict[str, Any]) -> Callable[[Any], bool] | None:
+    """Build a fast "is this instance valid?" check from the best installed backend.
+
+    jsonschema-rs (Rust) is preferred over fastjsonschema (generated Python).
+    Returns None when neither is installed.
+    """
+    if jsonschema_rs is not None:
+        rs_validator = jsonschema_rs.Draft7Validator(schema)
+
+        def rs_check(instance: Any) -> bool:
+            try:
+                return bool(rs_validator.is_valid(instance))
+            except ValueError:
+                # Not representable as JSON (e.g. non-string keys)
+                return False
+
+        return rs_check
+
+    if fastjsonschema is not None:
+        compiled = fastjsonschema.compile(schema)
+
+        def fast_check(instance: Any) -> bool:
+            try:
+                compiled(instance)
+            except fastjsonschema.JsonSchemaException:
+                return False
+            return True
+
+        return fast_check
+
+    return None
+
+
+# Fast validators for the common "instance is valid" case. On failure we still
+# ask jsonschema for the errors so messages stay the same whichever backend ran.
+_FAST_INIT = _compile_fast(INITIALIZE_RESPONSE_SCHEMA)
+_FAST_RESOURCE = _compile_fast(RESOURCE_SCHEMA)
+
+
+def _fast_valid(fast: Callable[[Any], bool] | None, instance: Any) -> bool:
+    """Return True if the fast validator accepts the instance."""
+    return fast is not None and fast(instance)
+
+
+def _error_messages(validator: Any, instance: Any) -> list[str]:
+    """Return every schema error for an instance, most relevant first.
+
+    The order matches jsonschema.validate(), which raises the best_match()
+    error, and each message says where in the instance it applies.
+    """
+    errors = sorted(
+        validator.iter_errors(instance), key=jsonschema.exceptions.relevance, reverse=True
+    )
+    return [f"{exc.json_path}: {exc.message}" for exc in errors]
+
+
+def _tool_shape_valid(tool: Any) -> bool:
+    """Hand-written equivalent of TOOL_SCHEMA for the common all-valid case.
+
+    Tool definitions have a small fixed shape, so a few isinstance checks beat
+    any generic schema engine. Keep this in step with TOOL_SCHEMA; on False the
+    caller asks jsonschema for the actual errors.
+    """
+    if not isinstance(tool, dict):
+        return False
+    name = tool.get("name")
+    if not isinstance(name, str) or not name:
+        return False
+    if not isinstance(tool.get("description"), str):
+        return False
+    input_schema = tool.get("inputSchema")
+    if not isinstance(input_schema, dict) or input_schema.get("type") != "object":
+        return False
+    if not isinstance(input_schema.get("properties", {}), dict):
+        return False
+    required = input_schema.get("required", [])
+    return isinstance(required, list) and all(isinstance(r, str) for r in required)
+
+
+_CONTENT_TYPES = frozenset(
+    TOOL_RESULT_SCHEMA["properties"]["content"]["items"]["properties"]["type"]["enum"]
+)
+
+
+def _tool_result_shape_valid(result: Any) -> bool:
+    """Hand-written equivalent of TOOL_RESULT_SCHEMA, walking content in place.
+
+    Keep this in step with TOOL_RESULT_SCHEMA; on False the caller asks
+    jsonschema for the actual errors.
+    """
+    if not isinstance(result, dict):
+        return False
+    content = result.get("content")
+    if not isinstance(content, list):
+        return False
+    for block in content:
+        if not isinstance(block, dict):
+            return False
+        block_type = block.get("type")
+        if not isinstance(block_type, str) or block_type not in _CONTENT_TYPES:
+            return False
+    return isinstance(result.get("isError", False), bool)
+
+
+# Reports and issues are created on every validate_* call, so drop the
+# per-instance __dict__ where dataclasses support it (Python 3.10+).
+_SLOTS: dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class ValidationIssue:
     """A single validation issue."""
 
@@ -85,7 +237,7 @@ class ValidationIssue:
     message: str
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ValidationReport:
     """Full validation report."""
 
@@ -101,7 +253,8 @@ class ValidationReport:
 
     @property
     def is_valid(self) -> bool:
-        return len(self.errors) == 0
+        # Stop at the first error instead of building the errors list
+        return not any(i.level == "error" for i in self.issues)
 
     def add_error(self, category: str, message: str) -> None:
         self.issues.append(ValidationIssue("error", category, message))
@@ -110,38 +263,69 @@ class ValidationReport:
         self.issues.append(ValidationIssue("warning", category, message))
 
 
+# Files checked by validate_project_structure, built once at import
+_REQUIRED_MODULES = frozenset({"server.py", "tools.py"})
+_RECOMMENDED_FILES = frozenset({"README.md", "Dockerfile", ".gitignore"})
+
+
+def _scan_names(directory: str | os.PathLike[str]) -> tuple[set[str], set[str]]:
+    """List a directory once, returning (all entry names, subdirectory names).
+
+    DirEntry.is_dir() uses the type scandir already read, so no extra stat() is
+    needed on most platforms. A directory that can't be listed yields empty sets.
+    """
+    names: set[str] = set()
+    dirs: set[str] = set()
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                names.add(entry.name)
+                if entry.is_dir():
+                    dirs.add(entry.name)
+    except OSError:
+        pass
+    return names, dirs
+
+
 def validate_project_structure(project_dir: Path) -> ValidationReport:
     """Validate that a project has the expected MCP server structure."""
     report = ValidationReport()
 
+    # Scan the project root once and check names in memory, not one stat() each
+    top_names, top_dirs = _scan_names(project_dir)
+
     # Check pyproject.toml exists
-    if not (project_dir / "pyproject.toml").exists():
+    if "pyproject.toml" not in top_names:
         report.add_error("structure", "Missing pyproject.toml")
 
     # Find the source package
     src_dir = project_dir / "src"
-    if not src_dir.exists():
+    if "src" not in top_dirs:
         report.add_error("structure", "Missing src/ directory")
         return report
 
-    packages = [d for d in src_dir.iterdir() if d.is_dir() and (d / "__init__.py").exists()]
-    if not packages:
+    # Stop at the first package instead of checking every entry in src/
+    with os.scandir(src_dir) as it:
+        pkg_path = next(
+            (
+                e.path for e in it
+                if e.is_dir() and os.path.exists(os.path.join(e.path, "__init__.py"))
+            ),
+            None,
+        )
+    if pkg_path is None:
         report.add_error("structure", "No Python package found in src/")
         return report
 
-    pkg = packages[0]
+    pkg_names, _ = _scan_names(pkg_path)
 
     # Check required modules
-    required_files = ["server.py", "tools.py"]
-    for f in required_files:
-        if not (pkg / f).exists():
-            report.add_error("structure", f"Missing {f} in package")
+    for f in sorted(_REQUIRED_MODULES - pkg_names):
+        report.add_error("structure", f"Missing {f} in package")
 
     # Check optional but recommended files
-    recommended = ["README.md", "Dockerfile", ".gitignore"]
-    for f in recommended:
-        if not (project_dir / f).exists():
-            report.add_warning("structure", f"Missing recommended file: {f}")
+    for f in sorted(_RECOMMENDED_FILES - top_names):
+        report.add_warning("structure", f"Missing recommended file: {f}")
 
     return report
 
@@ -154,19 +338,17 @@ def validate_tool_definitions(tools: list[dict[str, Any]]) -> ValidationReport:
         report.add_warning("tools", "No tools defined")
         return report
 
+    seen: set[str] = set()
     for i, tool in enumerate(tools):
-        try:
-            jsonschema.validate(tool, TOOL_SCHEMA)
-        except jsonschema.ValidationError as exc:
-            report.add_error("tools", f"Tool #{i} ({tool.get('name', '?')}): {exc.message}")
+        name = tool.get("name")
+        if not _tool_shape_valid(tool):
+            for message in _error_messages(_TOOL_VALIDATOR, tool):
+                report.add_error("tools", f"Tool #{i} ({tool.get('name', '?')}): {message}")
 
-    # Check for duplicate names
-    names = [t.get("name") for t in tools]
-    seen: set[str] = set()
-    for name in names:
+        # Check for duplicate names in the same pass
         if name in seen:
             report.add_error("tools", f"Duplicate tool name: {name}")
-        if name:
+        elif name:
             seen.add(name)
 
     return report
@@ -179,22 +361,20 @@ def validate_resource_definitions(resources: list[dict[str, Any]]) -> Validation
     if not resources:
         return report
 
-    for i, resource in enumerate(resources):
-        try:
-            jsonschema.validate(resource, RESOURCE_SCHEMA)
-        except jsonschema.ValidationError as exc:
-            report.add_error(
-                "resources",
-                f"Resource #{i} ({resource.get('name', '?')}): {exc.message}",
-            )
-
-    # Check for duplicate URIs
-    uris = [r.get("uri") for r in resources]
     seen: set[str] = set()
-    for uri in uris:
-        if uri and uri in seen:
+    for i, resource in enumerate(resources):
+        uri = resource.get("uri")
+        if not _fast_valid(_FAST_RESOURCE, resource):
+            for message in _error_messages(_RESOURCE_VALIDATOR, resource):
+                report.add_error(
+                    "resources",
+                    f"Resource #{i} ({resource.get('name', '?')}): {message}",
+                )
+
+        # Check for duplicate URIs in the same pass
+        if uri in seen:
             report.add_error("resources", f"Duplicate resource URI: {uri}")
-        if uri:
+        elif uri:
             seen.add(uri)
 
     return report
@@ -203,18 +383,18 @@ def validate_resource_definitions(resources: list[dict[str, Any]]) -> Validation
 def validate_initialize_response(response: dict[str, Any]) -> ValidationReport:
     """Validate an initialize response."""
     report = ValidationReport()
-    try:
-        jsonschema.validate(response, INITIALIZE_RESPONSE_SCHEMA)
-    except jsonschema.ValidationError as exc:
-        report.add_error("initialize", exc.message)
+    if _fast_valid(_FAST_INIT, response):
+        return report
+    for message in _error_messages(_INIT_VALIDATOR, response):
+        report.add_error("initialize", message)
     return report
 
 
 def validate_tool_result(result: dict[str, Any]) -> ValidationReport:
     """Validate a tool call result."""
     report = ValidationReport()
-    try:
-        jsonschema.validate(result, TOOL_RESULT_SCHEMA)
-    except jsonschema.ValidationError as exc:
-        report.add_error("tool_result", exc.message)
+    if _tool_result_shape_valid(result):
+        return report
+    for message in _error_messages(_TOOL_RESULT_VALIDATOR, result):
+        report.add_error("tool_result", message)
     return report
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import subprocess
+import sys
 from pathlib import Path
 
 from click.testing import CliRunner
@@ -26,6 +28,20 @@ class TestCLIGroup:
     def test_version_matches(self) -> None:
         assert __version__ == "0.1.1"
 
+    def test_version_skips_heavy_imports(self) -> None:
+        code = (
+            "import sys\n"
+            "from mcp_forge.cli import cli\n"
+            "try:\n"
+            "    cli(['--version'])\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "print(sorted(m for m in ('rich', 'jinja2', 'jsonschema') if m in sys.modules))\n"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip().endswith("[]")
+
 
 class TestNewCommand:
     def test_new_basic(self, tmp_path: Path) -> None:
@@ -9,10 +9,11 @@ from __future__ import annotations
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pytest
 from click.testing import CliRunner
 
 from mcp_forge.cli import cli
-from mcp_forge.tester import TestReport, TestResult
+from mcp_forge.tester import DEFAULT_TIMEOUT, TestReport, TestResult
 
 
 # ---------------------------------------------------------------------------
@@ -46,7 +47,7 @@ def _make_failing_report() -> TestReport:
 
 
 class TestTestCommand:
-    @patch("mcp_forge.cli.run_test_suite")
+    @patch("mcp_forge.tester.run_test_suite")
     def test_test_passing(self, mock_run: MagicMock) -> None:
         mock_run.return_value = _make_passing_report()
         runner = CliRunner()
@@ -54,14 +55,14 @@ class TestTestCommand:
         assert result.exit_code == 0
         assert "Testing" in result.output
 
-    @patch("mcp_forge.cli.run_test_suite")
+    @patch("mcp_forge.tester.run_test_suite")
     def test_test_failing_exits_1(self, mock_run: MagicMock) -> None:
         mock_run.return_value = _make_failing_report()
         runner = CliRunner()
         result = runner.invoke(cli, ["test", "--cmd", "python -m my_server.server"])
         assert result.exit_code == 1
 
-    @patch("mcp_forge.cli.run_test_suite")
+    @patch("mcp_forge.tester.run_test_suite")
     def test_test_with_cwd(self, mock_run: MagicMock, tmp_path: Path) -> None:
         mock_run.return_value = _make_passing_report()
         runner = CliRunner()
@@ -83,7 +84,7 @@ class TestTestCommand:
         assert result.exit_code != 0
         assert "Missing" in result.output or "required" in result.output.lower()
 
-    @patch("mcp_forge.cli.run_test_suite")
+    @patch("mcp_forge.tester.run_test_suite")
     def test_test_splits_cmd_string(self, mock_run: MagicMock) -> None:
         mock_run.return_value = _make_passing_report()
         runner = CliRunner()
@@ -92,6 +93,16 @@ class TestTestCommand:
         call_args = mock_run.call_args[0][0]  # first positional arg = server_cmd
         assert call_args == ["python", "-m", "my_server.server", "--port", "8080"]
 
+    @patch("mcp_forge.tester.run_test_suite")
+    def test_test_timeout(self, mock_run: MagicMock) -> None:
+        mock_run.return_value = _make_passing_report()
+        runner = CliRunner()
+        runner.invoke(cli, ["test", "--cmd", "python -m server"])
+        assert mock_run.call_args.kwargs["timeout"] == DEFAULT_TIMEOUT
+
+        runner.invoke(cli, ["test", "--cmd", "python -m server", "--timeout", "30"])
+        assert mock_run.call_args.kwargs["timeout"] == 30.0
+
 
 # ---------------------------------------------------------------------------
 # mcp-forge publish command
@@ -99,10 +110,16 @@ class TestTestCommand:
 
 
 class TestPublishCommand:
+    @pytest.fixture(autouse=True)
+    def _no_in_process_tools(self):
+        """Force the subprocess path even if build/twine are installed."""
+        with patch("mcp_forge.cli._run_in_process", return_value=None):
+            yield
+
     @patch("mcp_forge.cli.subprocess.run")
     def test_publish_dry_run(self, mock_run: MagicMock, tmp_path: Path) -> None:
         """Dry run should build but not upload."""
-        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+        mock_run.return_value = MagicMock(returncode=0, stdout=b"", stderr=None)
 
         # Create a minimal project dir
         project = tmp_path / "my-project"
@@ -119,7 +136,7 @@ class TestPublishCommand:
     @patch("mcp_forge.cli.subprocess.run")
     def test_publish_build_failure(self, mock_run: MagicMock, tmp_path: Path) -> None:
         """Build failure should exit with error."""
-        mock_run.return_value = MagicMock(returncode=1, stdout="", stderr="build error")
+        mock_run.return_value = MagicMock(returncode=1, stdout=b"build error", stderr=None)
 
         project = tmp_path / "fail-project"
         project.mkdir()
@@ -129,14 +146,15 @@ class TestPublishCommand:
         result = runner.invoke(cli, ["publish", str(project)])
         assert result.exit_code == 1
         assert "Build failed" in result.output
+        assert "build error" in result.output
 
     @patch("mcp_forge.cli.subprocess.run")
     def test_publish_upload_failure(self, mock_run: MagicMock, tmp_path: Path) -> None:
         """Upload failure should exit with error."""
         # First call (build) succeeds, second call (upload) fails
         mock_run.side_effect = [
-            MagicMock(returncode=0, stdout="", stderr=""),
-            MagicMock(returncode=1, stdout="", stderr="auth error"),
+            MagicMock(returncode=0, stdout=b"", stderr=None),
+            MagicMock(returncode=1, stdout=b"auth error", stderr=None),
         ]
 
         project = tmp_path / "upload-fail"
@@ -147,11 +165,12 @@ class TestPublishCommand:
         result = runner.invoke(cli, ["publish", str(project)])
         assert result.exit_code == 1
         assert "Upload failed" in result.output
+        assert "auth error" in result.output
 
     @patch("mcp_forge.cli.subprocess.run")
     def test_publish_success(self, mock_run: MagicMock, tmp_path: Path) -> None:
         """Successful build and upload."""
-        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+        mock_run.return_value = MagicMock(returncode=0, stdout=b"", stderr=None)
 
         project = tmp_path / "good-project"
         project.mkdir()
@@ -166,7 +185,7 @@ class TestPublishCommand:
     @patch("mcp_forge.cli.subprocess.run")
     def test_publish_to_testpypi(self, mock_run: MagicMock, tmp_path: Path) -> None:
         """Publishing to testpypi should use the test URL."""
-        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+        mock_run.return_value = MagicMock(returncode=0, stdout=b"", stderr=None)
 
         project = tmp_path / "testpypi-project"
         project.mkdir()
@@ -187,6 +206,47 @@ class TestPublishCommand:
         assert result.exit_code != 0
 
 
+class TestPublishInProcess:
+    @patch("mcp_forge.cli.subprocess.run")
+    @patch("mcp_forge.cli._run_in_process", return_value=(0, ""))
+    def test_in_process_skips_subprocess(
+        self, mock_in_process: MagicMock, mock_run: MagicMock, tmp_path: Path
+    ) -> None:
+        runner = CliRunner()
+        result = runner.invoke(cli, ["publish", str(tmp_path)])
+        assert result.exit_code == 0
+        assert "Published" in result.output
+        assert [c.args[0] for c in mock_in_process.call_args_list] == ["build", "twine"]
+        mock_run.assert_not_called()
+
+    @patch("mcp_forge.cli._run_in_process", return_value=(1, "invalid credentials"))
+    def test_in_process_failure_shows_detail(
+        self, mock_in_process: MagicMock, tmp_path: Path
+    ) -> None:
+        runner = CliRunner()
+        result = runner.invoke(cli, ["publish", str(tmp_path)])
+        assert result.exit_code == 1
+        assert "Build failed" in result.output
+        assert "invalid credentials" in result.output
+
+    def test_missing_tool_returns_none(self, tmp_path: Path) -> None:
+        from mcp_forge.cli import _run_in_process
+
+        with patch.dict("sys.modules", {"twine.cli": None}):
+            assert _run_in_process("twine", ["upload"], tmp_path) is None
+
+    def test_system_exit_code_is_returned(self, tmp_path: Path) -> None:
+        from mcp_forge.cli import _run_in_process
+
+        def fake_main(args: list[str]) -> None:
+            assert Path.cwd() == tmp_path
+            raise SystemExit(2)
+
+        fake_module = MagicMock(main=fake_main)
+        with patch.dict("sys.modules", {"build.__main__": fake_module}):
+            assert _run_in_process("build", [], tmp_path) == (2, "")
+
+
 # ---------------------------------------------------------------------------
 # _print_tree (indirectly tested via new command output)
 # ---------------------------------------------------------------------------
@@ -38,7 +38,7 @@ class TestInspect:
         assert "Inspect" in result.output or "inspect" in result.output
         assert "--cmd" in result.output
 
-    @patch("mcp_forge.cli.MCPTestClient")
+    @patch("mcp_forge.tester.MCPTestClient")
     def test_inspect_rich_output(self, mock_cls, runner):
         mock_client = MagicMock()
         mock_cls.return_value = mock_client
@@ -71,7 +71,13 @@ class TestInspect:
         mock_client.start.assert_called_once()
         mock_client.stop.assert_called_once()
 
-    @patch("mcp_forge.cli.MCPTestClient")
+    @patch("mcp_forge.tester.MCPTestClient")
+    def test_inspect_timeout(self, mock_cls, runner):
+        mock_cls.return_value.start.side_effect = RuntimeError("stop here")
+        runner.invoke(cli, ["inspect", "--cmd", "python server.py", "--timeout", "2.5"])
+        assert mock_cls.call_args.kwargs["timeout"] == 2.5
+
+    @patch("mcp_forge.tester.MCPTestClient")
     def test_inspect_json_output(self, mock_cls, runner):
         mock_client = MagicMock()
         mock_cls.return_value = mock_client
@@ -94,7 +100,7 @@ class TestInspect:
         assert data["tools"] == []
         assert data["resources"] == []
 
-    @patch("mcp_forge.cli.MCPTestClient")
+    @patch("mcp_forge.tester.MCPTestClient")
     def test_inspect_no_tools_no_resources(self, mock_cls, runner):
         mock_client = MagicMock()
         mock_cls.return_value = mock_client
@@ -113,7 +119,7 @@ class TestInspect:
         assert result.exit_code == 0
         assert "No tools registered" in result.output
 
-    @patch("mcp_forge.cli.MCPTestClient")
+    @patch("mcp_forge.tester.MCPTestClient")
     def test_inspect_start_failure(self, mock_cls, runner):
         mock_client = MagicMock()
         mock_cls.return_value = mock_client
@@ -123,7 +129,7 @@ class TestInspect:
         assert result.exit_code != 0
         assert "Failed to start server" in result.output
 
-    @patch("mcp_forge.cli.MCPTestClient")
+    @patch("mcp_forge.tester.MCPTestClient")
     def test_inspect_communication_error(self, mock_cls, runner):
         mock_client = MagicMock()
         mock_cls.return_value = mock_client
@@ -134,7 +140,7 @@ class TestInspect:
         assert "Error communicating" in result.output
         mock_client.stop.assert_called_once()
 
-    @patch("mcp_forge.cli.MCPTestClient")
+    @patch("mcp_forge.tester.MCPTestClient")
     def test_inspect_multiple_tools(self, mock_cls, runner):
         mock_client = MagicMock()
         mock_cls.return_value = mock_client
@@ -161,7 +167,7 @@ class TestInspect:
         assert "tool_4" in result.output
         assert "Tools (5)" in result.output
 
-    @patch("mcp_forge.cli.MCPTestClient")
+    @patch("mcp_forge.tester.MCPTestClient")
     def test_inspect_with_cwd(self, mock_cls, runner, tmp_path):
         mock_client = MagicMock()
         mock_cls.return_value = mock_client
@@ -2,8 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
+import importlib
+import importlib.util
+import json
+import sys
 from pathlib import Path
 
+import pytest
 
 from mcp_forge.scaffold import get_template_env, scaffold_project, snake_case, title_case
 
@@ -88,6 +94,42 @@ class TestScaffoldProject:
         assert "weather" in tools_content
         assert "calculator" in tools_content
 
+    def test_generated_tools_dispatch_by_name(self, tmp_path: Path) -> None:
+        project = scaffold_project(
+            "test-server", output_dir=tmp_path, tools=["weather", "calculator"]
+        )
+        tools_py = project / "src" / "test_server" / "tools.py"
+        spec = importlib.util.spec_from_file_location("generated_tools", tools_py)
+        assert spec is not None and spec.loader is not None
+        mod = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(mod)
+
+        result = asyncio.run(mod.handle_tool_call("calculator", {"query": "1+1"}))
+        assert result["content"][0]["text"] == "calculator result for: 1+1"
+        with pytest.raises(ValueError, match="Unknown tool"):
+            asyncio.run(mod.handle_tool_call("missing", {}))
+
+    def test_generated_server_handles_what_stdlib_json_can(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        project = scaffold_project("dumps-check-server", output_dir=tmp_path)
+        monkeypatch.syspath_prepend(str(project / "src"))
+        try:
+            mod = importlib.import_module("dumps_check_server.server")
+            # orjson rejects both of these by default; the stdlib does not
+            message = {"jsonrpc": "2.0", "id": 1, "result": {1: "a", "big": 2**70}}
+            line = mod._dumps_line(message)
+            # and both directions agree with the stdlib on NaN and big ints
+            request = mod._loads(b'{"jsonrpc": "2.0", "id": 1, "params": {"x": NaN, "n": '
+                                 + str(2**70).encode() + b"}}")
+        finally:
+            for name in [m for m in sys.modules if m.startswith("dumps_check_server")]:
+                del sys.modules[name]
+        assert line.endswith(b"\n")
+        assert json.loads(line) == json.loads(json.dumps(message))
+        assert request["params"]["x"] != request["params"]["x"]  # NaN
+        assert request["params"]["n"] == 2**70
+
     def test_custom_resources(self, tmp_path: Path) -> None:
         project = scaffold_project(
             "test-server", output_dir=tmp_path, resources=["file://data"]
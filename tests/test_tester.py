@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from dataclasses import asdict
 from pathlib import Path
 
 import pytest
@@ -63,6 +64,26 @@ class TestTestReport:
         assert report.passed == 0
         assert report.failed == 2
 
+    def test_add_updates_counts(self) -> None:
+        report = TestReport(results=[TestResult("a", True)])
+        report.add(TestResult("b", False))
+        report.add(TestResult("c", True))
+        assert report.total == 3
+        assert report.passed == 2
+        assert report.failed == 1
+
+    def test_direct_append_updates_counts(self) -> None:
+        report = TestReport()
+        report.results.append(TestResult("a", True))
+        assert report.passed == 1
+        assert report.failed == 0
+        report.results = [TestResult("b", False)]
+        assert report.passed == 0
+        assert report.failed == 1
+        report.results[0] = TestResult("b", True)
+        assert (report.passed, report.failed) == (1, 0)
+        assert asdict(report) == {"results": [asdict(TestResult("b", True))]}
+
 
 class TestMCPTestClient:
     def test_client_init(self) -> None:
@@ -7,6 +7,7 @@ with mocked subprocess, and run_test_suite with various server responses.
 from __future__ import annotations
 
 import json
+import os
 from io import BytesIO, StringIO
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -192,6 +193,73 @@ class TestMCPTestClientSendRequest:
         with pytest.raises(RuntimeError, match="No response"):
             client.send_request("initialize")
 
+    @patch("mcp_forge.tester.subprocess.Popen")
+    def test_send_request_times_out(self, mock_popen: MagicMock) -> None:
+        read_fd, write_fd = os.pipe()
+        proc = _make_mock_process()
+        proc.stdout = os.fdopen(read_fd, "rb")  # never receives a reply
+        mock_popen.return_value = proc
+
+        client = MCPTestClient(["python", "srv.py"], timeout=0.05)
+        client.start()
+        try:
+            with pytest.raises(TimeoutError, match="No response"):
+                client.send_request("ping")
+        finally:
+            os.close(write_fd)
+            client._lines.get(timeout=1)  # reader thread saw EOF and exited
+            proc.stdout.close()
+
+    @patch("mcp_forge.tester.subprocess.Popen")
+    def test_late_reply_is_not_taken_by_next_request(self, mock_popen: MagicMock) -> None:
+        read_fd, write_fd = os.pipe()
+        proc = _make_mock_process()
+        proc.stdout = os.fdopen(read_fd, "rb")
+        mock_popen.return_value = proc
+
+        client = MCPTestClient(["python", "srv.py"], timeout=0.05)
+        client.start()
+        try:
+            with pytest.raises(TimeoutError):
+                client.send_request("initialize")
+            # The initialize reply shows up after its timeout, then tools/list's
+            late = [_jsonrpc_result(1, {"protocolVersion": "2024-11-05"}),
+                    _jsonrpc_result(2, {"tools": []})]
+            os.write(write_fd, b"".join(json.dumps(r).encode() + b"\n" for r in late))
+            resp = client.send_request("tools/list")
+            assert resp["id"] == 2
+            assert resp["result"] == {"tools": []}
+        finally:
+            os.close(write_fd)
+            client._lines.get(timeout=1)
+            proc.stdout.close()
+
+    @patch("mcp_forge.tester.subprocess.Popen")
+    def test_send_request_encodes_what_stdlib_json_can(self, mock_popen: MagicMock) -> None:
+        proc = _make_mock_process([_jsonrpc_result(1, {})])
+        mock_popen.return_value = proc
+
+        client = MCPTestClient(["python", "srv.py"])
+        client.start()
+        # orjson rejects both of these by default; the stdlib does not
+        client.send_request("tools/call", {1: "a", "big": 2**70})
+
+        written = json.loads(proc.stdin.write.call_args[0][0])
+        assert written["params"] == {"1": "a", "big": 2**70}
+
+    @patch("mcp_forge.tester.subprocess.Popen")
+    def test_send_request_decodes_what_stdlib_json_can(self, mock_popen: MagicMock) -> None:
+        # A stdlib json server writes NaN by default and keeps big ints exact
+        proc = _make_mock_process([_jsonrpc_result(1, {"x": float("nan"), "big": 2**70})])
+        mock_popen.return_value = proc
+
+        client = MCPTestClient(["python", "srv.py"])
+        client.start()
+        resp = client.send_request("tools/call")
+
+        assert resp["result"]["x"] != resp["result"]["x"]  # NaN
+        assert resp["result"]["big"] == 2**70
+
     def test_send_request_not_started_raises(self) -> None:
         client = MCPTestClient(["python", "srv.py"])
         with pytest.raises(RuntimeError, match="Server not started"):
@@ -211,6 +279,61 @@ class TestMCPTestClientSendRequest:
         assert resp["error"]["message"] == "Method not found"
 
 
+class TestMCPTestClientSendRequestsBatch:
+    @patch("mcp_forge.tester.subprocess.Popen")
+    def test_batch_writes_once_and_matches_ids(self, mock_popen: MagicMock) -> None:
+        # Server answers out of order
+        proc = _make_mock_process([
+            _jsonrpc_error(2, -32601, "Method not found"),
+            _jsonrpc_result(1, {}),
+        ])
+        proc.stdin = MagicMock()
+        mock_popen.return_value = proc
+
+        client = MCPTestClient(["python", "srv.py"])
+        client.start()
+
+        ping, unknown = client.send_requests_batch([("ping", None), ("nope", None)])
+
+        assert "result" in ping
+        assert "error" in unknown
+        proc.stdin.write.assert_called_once()
+        proc.stdin.flush.assert_called_once()
+        written = proc.stdin.write.call_args[0][0].decode().splitlines()
+        assert [json.loads(line)["method"] for line in written] == ["ping", "nope"]
+
+    @patch("mcp_forge.tester.subprocess.Popen")
+    def test_batch_missing_response_raises(self, mock_popen: MagicMock) -> None:
+        proc = _make_mock_process([_jsonrpc_result(1, {})])
+        mock_popen.return_value = proc
+
+        client = MCPTestClient(["python", "srv.py"])
+        client.start()
+
+        with pytest.raises(RuntimeError, match="No response"):
+            client.send_requests_batch([("ping", None), ("ping", None)])
+
+    @patch("mcp_forge.tester.subprocess.Popen")
+    def test_batch_skips_stale_replies(self, mock_popen: MagicMock) -> None:
+        proc = _make_mock_process([
+            _jsonrpc_result(7, {"stale": True}),
+            _jsonrpc_result(2, {}),
+            _jsonrpc_result(1, {}),
+        ])
+        mock_popen.return_value = proc
+
+        client = MCPTestClient(["python", "srv.py"])
+        client.start()
+
+        first, second = client.send_requests_batch([("ping", None), ("ping", None)])
+        assert (first["id"], second["id"]) == (1, 2)
+
+    def test_batch_not_started_raises(self) -> None:
+        client = MCPTestClient(["python", "srv.py"])
+        with pytest.raises(RuntimeError, match="Server not started"):
+            client.send_requests_batch([("ping", None)])
+
+
 class TestMCPTestClientSendNotification:
     @patch("mcp_forge.tester.subprocess.Popen")
     def test_send_notification_basic(self, mock_popen: MagicMock) -> None:
@@ -288,14 +411,13 @@ class TestRunTestSuiteMocked:
             "content": [{"type": "text", "text": "Hello, world!"}]
         }
         ping_result = {}
-        error_resp = _jsonrpc_error(6, -32601, "Method not found")
+        error_resp = _jsonrpc_error(5, -32601, "Method not found")
 
         responses = [
             _jsonrpc_result(1, init_result),       # initialize
-            _jsonrpc_result(2, tools_list_result),  # tools/list
-            _jsonrpc_result(3, tools_list_result),  # tools/list (for tools/call test)
-            _jsonrpc_result(4, tool_call_result),   # tools/call
-            _jsonrpc_result(5, ping_result),        # ping
+            _jsonrpc_result(2, tools_list_result),  # tools/list (reused by tools/call test)
+            _jsonrpc_result(3, tool_call_result),   # tools/call
+            _jsonrpc_result(4, ping_result),        # ping
             error_resp,                              # unknown method
         ]
 
@@ -315,9 +437,8 @@ class TestRunTestSuiteMocked:
         responses = [
             _jsonrpc_error(1, -32600, "Invalid request"),
             _jsonrpc_result(2, {"tools": []}),  # tools/list
-            _jsonrpc_result(3, {"tools": []}),  # tools/list for call
-            _jsonrpc_result(4, {}),              # ping
-            _jsonrpc_error(5, -32601, "Not found"),  # unknown
+            _jsonrpc_result(3, {}),              # ping
+            _jsonrpc_error(4, -32601, "Not found"),  # unknown
         ]
 
         proc = _make_mock_process(responses)
@@ -340,9 +461,8 @@ class TestRunTestSuiteMocked:
         responses = [
             _jsonrpc_result(1, init_result),
             _jsonrpc_result(2, {"tools": []}),   # tools/list
-            _jsonrpc_result(3, {"tools": []}),   # tools/list for call check
-            _jsonrpc_result(4, {}),              # ping
-            _jsonrpc_error(5, -32601, "nope"),   # unknown
+            _jsonrpc_result(3, {}),              # ping
+            _jsonrpc_error(4, -32601, "nope"),   # unknown
         ]
 
         proc = _make_mock_process(responses)
@@ -366,9 +486,8 @@ class TestRunTestSuiteMocked:
         responses = [
             _jsonrpc_result(1, bad_init),
             _jsonrpc_result(2, {"tools": []}),
-            _jsonrpc_result(3, {"tools": []}),
-            _jsonrpc_result(4, {}),
-            _jsonrpc_error(5, -32601, "nope"),
+            _jsonrpc_result(3, {}),
+            _jsonrpc_error(4, -32601, "nope"),
         ]
 
         proc = _make_mock_process(responses)
@@ -393,10 +512,9 @@ class TestRunTestSuiteMocked:
         responses = [
             _jsonrpc_result(1, init_result),
             _jsonrpc_result(2, tools),
-            _jsonrpc_result(3, tools),
-            _jsonrpc_error(4, -32000, "Tool execution failed"),  # tools/call error
-            _jsonrpc_result(5, {}),
-            _jsonrpc_error(6, -32601, "nope"),
+            _jsonrpc_error(3, -32000, "Tool execution failed"),  # tools/call error
+            _jsonrpc_result(4, {}),
+            _jsonrpc_error(5, -32601, "nope"),
         ]
 
         proc = _make_mock_process(responses)
@@ -420,10 +538,9 @@ class TestRunTestSuiteMocked:
         responses = [
             _jsonrpc_result(1, init_result),
             _jsonrpc_result(2, tools),
-            _jsonrpc_result(3, tools),
-            _jsonrpc_result(4, {"content": []}),  # empty content
-            _jsonrpc_result(5, {}),
-            _jsonrpc_error(6, -32601, "nope"),
+            _jsonrpc_result(3, {"content": []}),  # empty content
+            _jsonrpc_result(4, {}),
+            _jsonrpc_error(5, -32601, "nope"),
         ]
 
         proc = _make_mock_process(responses)
@@ -446,9 +563,8 @@ class TestRunTestSuiteMocked:
         responses = [
             _jsonrpc_result(1, init_result),
             _jsonrpc_result(2, {"tools": []}),
-            _jsonrpc_result(3, {"tools": []}),
-            _jsonrpc_error(4, -32601, "Ping not supported"),  # ping error
-            _jsonrpc_result(5, {}),  # unknown method returns result (wrong)
+            _jsonrpc_error(3, -32601, "Ping not supported"),  # ping error
+            _jsonrpc_result(4, {}),  # unknown method returns result (wrong)
         ]
 
         proc = _make_mock_process(responses)
@@ -471,9 +587,8 @@ class TestRunTestSuiteMocked:
         responses = [
             _jsonrpc_result(1, init_result),
             _jsonrpc_result(2, {"tools": []}),
-            _jsonrpc_result(3, {"tools": []}),
-            _jsonrpc_result(4, {}),               # ping OK
-            _jsonrpc_result(5, {"unexpected": 1}), # unknown method returns result (BAD)
+            _jsonrpc_result(3, {}),               # ping OK
+            _jsonrpc_result(4, {"unexpected": 1}), # unknown method returns result (BAD)
         ]
 
         proc = _make_mock_process(responses)
@@ -2,14 +2,20 @@
 
 from __future__ import annotations
 
+import sys
+from dataclasses import asdict
 from pathlib import Path
 
+import jsonschema
+import pytest
 
+from mcp_forge import validator
 from mcp_forge.validator import (
     ValidationIssue,
     ValidationReport,
     validate_initialize_response,
     validate_project_structure,
+    validate_resource_definitions,
     validate_tool_definitions,
     validate_tool_result,
 )
@@ -45,6 +51,39 @@ class TestValidationReport:
         assert len(report.warnings) == 1
         assert len(report.issues) == 3
 
+    def test_issues_passed_to_constructor(self) -> None:
+        report = ValidationReport(issues=[
+            ValidationIssue("warning", "a", "warning1"),
+            ValidationIssue("error", "b", "error1"),
+        ])
+        assert not report.is_valid
+        assert [e.message for e in report.errors] == ["error1"]
+        assert [w.message for w in report.warnings] == ["warning1"]
+
+    def test_direct_append_updates_counts(self) -> None:
+        report = ValidationReport()
+        report.issues.append(ValidationIssue("error", "a", "error1"))
+        assert not report.is_valid
+        assert len(report.errors) == 1
+        report.issues.clear()
+        assert report.is_valid
+        report.add_error("a", "error2")
+        assert not report.is_valid
+        report.issues.pop()
+        report.issues.append(ValidationIssue("warning", "b", "warning1"))
+        assert report.is_valid
+        assert report.errors == []
+        assert len(report.warnings) == 1
+        # Returned lists are copies, so mutating them leaves the report alone
+        report.errors.append(ValidationIssue("error", "c", "error3"))
+        assert report.is_valid
+        assert set(asdict(report)) == {"issues"}
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10+")
+    def test_slotted(self) -> None:
+        assert not hasattr(ValidationReport(), "__dict__")
+        assert not hasattr(ValidationIssue("error", "a", "b"), "__dict__")
+
 
 class TestValidationIssue:
     def test_issue_fields(self) -> None:
@@ -65,6 +104,12 @@ class TestValidateProjectStructure:
         assert not report.is_valid
         assert any("src" in e.message for e in report.errors)
 
+    def test_src_is_a_file(self, tmp_path: Path) -> None:
+        (tmp_path / "pyproject.toml").write_text("[project]\nname='test'")
+        (tmp_path / "src").write_text("")
+        report = validate_project_structure(tmp_path)
+        assert any("Missing src/" in e.message for e in report.errors)
+
     def test_empty_src_dir(self, tmp_path: Path) -> None:
         (tmp_path / "pyproject.toml").write_text("[project]\nname='test'")
         (tmp_path / "src").mkdir()
@@ -154,6 +199,21 @@ class TestValidateToolDefinitions:
         report = validate_tool_definitions(tools)
         assert not report.is_valid
 
+    def test_reports_every_issue_per_tool(self) -> None:
+        tools = [{"name": ""}]
+        report = validate_tool_definitions(tools)
+        # Empty name, missing description and missing inputSchema
+        assert len(report.errors) == 3
+        assert all(e.message.startswith("Tool #0") for e in report.errors)
+
+    def test_messages_name_the_failing_field(self) -> None:
+        tools = [{"name": 1, "description": 1, "inputSchema": {"type": "object"}}]
+        messages = [e.message for e in validate_tool_definitions(tools).errors]
+        assert messages == [
+            "Tool #0 (1): $.name: 1 is not of type 'string'",
+            "Tool #0 (1): $.description: 1 is not of type 'string'",
+        ]
+
     def test_triple_duplicates(self) -> None:
         tools = [
             {"name": "x", "description": "A", "inputSchema": {"type": "object"}},
@@ -182,6 +242,19 @@ class TestValidateInitializeResponse:
         report = validate_initialize_response(resp)
         assert not report.is_valid
 
+    def test_reports_every_issue(self) -> None:
+        resp = {"protocolVersion": 1, "serverInfo": {"name": "test"}}
+        report = validate_initialize_response(resp)
+        # Missing capabilities, non-string protocolVersion, missing serverInfo.version
+        assert len(report.errors) == 3
+
+    def test_first_error_matches_jsonschema_validate(self) -> None:
+        resp = {"serverInfo": 3, "capabilities": [], "protocolVersion": 1}
+        with pytest.raises(jsonschema.ValidationError) as exc_info:
+            jsonschema.validate(resp, validator.INITIALIZE_RESPONSE_SCHEMA)
+        first = validate_initialize_response(resp).errors[0].message
+        assert first == f"$.serverInfo: {exc_info.value.message}"
+
     def test_missing_capabilities(self) -> None:
         resp = {
             "protocolVersion": "2024-11-05",
@@ -236,6 +309,12 @@ class TestValidateToolResult:
         report = validate_tool_result(result)
         assert report.is_valid
 
+    def test_first_error_matches_jsonschema_validate(self) -> None:
+        result = {"content": [{"type": "video"}], "isError": "no"}
+        errors = validate_tool_result(result).errors
+        assert errors[0].message == "$.isError: 'no' is not of type 'boolean'"
+        assert errors[1].message.startswith("$.content[0].type: ")
+
     def test_multiple_content_items(self) -> None:
         result = {
             "content": [
@@ -245,3 +324,99 @@ class TestValidateToolResult:
         }
         report = validate_tool_result(result)
         assert report.is_valid
+
+
+class TestBuildValidator:
+    def test_rejects_invalid_schema(self) -> None:
+        with pytest.raises(jsonschema.SchemaError):
+            validator._build_validator({"type": "nope"})
+
+    def test_no_fast_backend(self, monkeypatch) -> None:
+        monkeypatch.setattr(validator, "jsonschema_rs", None)
+        monkeypatch.setattr(validator, "fastjsonschema", None)
+        assert validator._compile_fast(validator.RESOURCE_SCHEMA) is None
+
+
+class TestFastPathParity:
+    """The compiled fast path must agree with plain jsonschema validation."""
+
+    OBJ = {"type": "object"}
+    CASES = [
+        (validate_tool_definitions, [{"name": "a", "description": "A", "inputSchema": OBJ}]),
+        (validate_tool_definitions, [{"name": "", "inputSchema": {"type": "array"}}]),
+        (validate_tool_definitions, [{"name": "a", "description": 1, "inputSchema": OBJ}]),
+        (validate_initialize_response, {
+            "protocolVersion": "2024-11-05",
+            "capabilities": {},
+            "serverInfo": {"name": "s", "version": "1"},
+        }),
+        (validate_initialize_response, {"protocolVersion": "1.0", "serverInfo": {"name": "s"}}),
+        (validate_initialize_response, {1: "non-string key"}),
+        (validate_resource_definitions, [{"uri": "file:///a", "name": "a"}]),
+        (validate_resource_definitions, [{"uri": "", "name": 1}]),
+        (validate_tool_result, {"content": [{"type": "text", "text": "hi"}], "isError": False}),
+        (validate_tool_result, {"content": [{"type": "video"}], "isError": "no"}),
+    ]
+
+    @pytest.mark.parametrize("backend", ["jsonschema_rs", "fastjsonschema"])
+    @pytest.mark.parametrize("func,instance", CASES)
+    def test_same_result_without_fast_path(self, backend, func, instance, monkeypatch) -> None:
+        pytest.importorskip(backend)
+        if backend == "fastjsonschema":
+            monkeypatch.setattr(validator, "jsonschema_rs", None)
+        # Rebuild the compiled validators with only the chosen backend available
+        monkeypatch.setattr(validator, "_FAST_INIT",
+                            validator._compile_fast(validator.INITIALIZE_RESPONSE_SCHEMA))
+        monkeypatch.setattr(validator, "_FAST_RESOURCE",
+                            validator._compile_fast(validator.RESOURCE_SCHEMA))
+        assert validator._FAST_INIT is not None
+        fast = func(instance)
+
+        for name in ("_FAST_INIT", "_FAST_RESOURCE"):
+            monkeypatch.setattr(validator, name, None)
+        monkeypatch.setattr(validator, "_tool_shape_valid", lambda tool: False)
+        monkeypatch.setattr(validator, "_tool_result_shape_valid", lambda result: False)
+        slow = func(instance)
+        assert fast.is_valid == slow.is_valid
+        assert [e.message for e in fast.errors] == [e.message for e in slow.errors]
+
+    @pytest.mark.parametrize("tool", [
+        {"name": "a", "description": "A", "inputSchema": {"type": "object"}},
+        {"name": "a", "description": "A", "inputSchema": {
+            "type": "object", "properties": {"x": {}}, "required": ["x"],
+        }},
+        {"name": "a", "description": "A", "extra": 1, "inputSchema": {"type": "object"}},
+        "not a dict",
+        {"description": "A", "inputSchema": {"type": "object"}},
+        {"name": "", "description": "A", "inputSchema": {"type": "object"}},
+        {"name": 1, "description": "A", "inputSchema": {"type": "object"}},
+        {"name": "a", "inputSchema": {"type": "object"}},
+        {"name": "a", "description": None, "inputSchema": {"type": "object"}},
+        {"name": "a", "description": "A", "inputSchema": []},
+        {"name": "a", "description": "A", "inputSchema": {}},
+        {"name": "a", "description": "A", "inputSchema": {"type": "string"}},
+        {"name": "a", "description": "A", "inputSchema": {"type": "object", "properties": []}},
+        {"name": "a", "description": "A", "inputSchema": {"type": "object", "required": "x"}},
+        {"name": "a", "description": "A", "inputSchema": {"type": "object", "required": [1]}},
+    ])
+    def test_tool_shape_check_matches_schema(self, tool) -> None:
+        expected = not any(validator._TOOL_VALIDATOR.iter_errors(tool))
+        assert validator._tool_shape_valid(tool) is expected
+
+    @pytest.mark.parametrize("result", [
+        {"content": []},
+        {"content": [{"type": "text", "text": "hi"}, {"type": "image"}], "isError": True},
+        {"content": [{"type": "resource"}], "extra": 1},
+        [],
+        {},
+        {"content": {}},
+        {"content": ["text"]},
+        {"content": [{}]},
+        {"content": [{"type": "video"}]},
+        {"content": [{"type": 1}]},
+        {"content": [], "isError": "no"},
+        {"content": [], "isError": 0},
+    ])
+    def test_tool_result_shape_check_matches_schema(self, result) -> None:
+        expected = not any(validator._TOOL_RESULT_VALIDATOR.iter_errors(result))
+        assert validator._tool_result_shape_valid(result) is expected